@@ -0,0 +1,185 @@
+import asyncio
+import logging
+from functools import lru_cache, partial, wraps
+from typing import Any, Callable, Optional, Set
+
+import msgspec
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+from pydantic import BaseModel, TypeAdapter
+from pydantic.errors import PydanticSchemaGenerationError
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from app.core.config import get_settings
+from app.models import Category, Product
+from app.schemas.user import User
+
+logger = logging.getLogger(__name__)
+
+# TTLs in seconds
+PRODUCT_TTL = 300
+CATEGORY_TREE_TTL = 3600
+
+CATEGORY_TREE_KEY = "category:tree"
+
+# Session.info key collecting cache keys to drop once the transaction commits
+_STALE_KEYS = "cache_stale_keys"
+
+
+def product_key(product_id: int) -> str:
+    return f"product:{product_id}"
+
+
+def session_key(jti: str) -> str:
+    return f"session:{jti}"
+
+
+# One connection pool per process
+@lru_cache(maxsize=1)
+def get_redis() -> redis.Redis:
+    return redis.Redis.from_url(get_settings().REDIS_URL)
+
+
+def _enc_hook(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise NotImplementedError(f"Cannot cache objects of type {type(obj)}")
+
+
+_encoder = msgspec.msgpack.Encoder(enc_hook=_enc_hook)
+
+
+# Build a bytes -> value decoder for type_, once per cached function.
+# Pydantic types (models, List[Model], ...) go through a TypeAdapter;
+# types Pydantic can't handle (msgspec Structs) are decoded by msgspec directly.
+def _decoder_for(type_: Any) -> Callable[[bytes], Any]:
+    try:
+        adapter = TypeAdapter(type_)
+    except PydanticSchemaGenerationError:
+        return msgspec.msgpack.Decoder(type_).decode
+    return lambda raw: adapter.validate_python(msgspec.msgpack.decode(raw))
+
+
+_decode_user = _decoder_for(User)
+
+
+# Read-through cache for async loaders returning a schema (Pydantic model,
+# msgspec.Struct, or a list of either). key_func builds the Redis key from the
+# wrapped function's arguments; the result is stored msgpack-encoded with SETEX
+# and decoded back into type_ on hit. Redis errors are logged and the loader
+# is used directly, so an unavailable cache never fails a read.
+def cached(key_func: Callable[..., str], ttl: int, type_: Any):
+    decode = _decoder_for(type_)
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            client = get_redis()
+            key = key_func(*args, **kwargs)
+            try:
+                raw = await client.get(key)
+            except RedisError:
+                logger.warning("Cache GET failed for %s", key, exc_info=True)
+                return await func(*args, **kwargs)
+            if raw is not None:
+                return decode(raw)
+            value = await func(*args, **kwargs)
+            if value is not None:
+                try:
+                    await client.setex(key, ttl, _encoder.encode(value))
+                except RedisError:
+                    logger.warning("Cache SETEX failed for %s", key, exc_info=True)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+# Sessions are keyed by JWT jti and expire together with the token
+async def set_session(jti: str, user: User, expires_in: int) -> None:
+    await get_redis().setex(session_key(jti), expires_in, _encoder.encode(user))
+
+
+async def get_session(jti: str) -> Optional[User]:
+    raw = await get_redis().get(session_key(jti))
+    if raw is None:
+        return None
+    return _decode_user(raw)
+
+
+async def delete_session(jti: str) -> None:
+    await get_redis().delete(session_key(jti))
+
+
+# Invalidation: mapper events fire during flush, before the transaction is
+# visible to other readers. Collect the keys on the session and drop them only
+# after commit, so a concurrent read can't re-cache the old row.
+def _mark_stale(target: Any, key: str) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_STALE_KEYS, set()).add(key)
+
+
+@event.listens_for(Product, "after_update")
+@event.listens_for(Product, "after_delete")
+def _invalidate_product(mapper, connection, target) -> None:
+    _mark_stale(target, product_key(target.id))
+
+
+@event.listens_for(Category, "after_insert")
+@event.listens_for(Category, "after_update")
+@event.listens_for(Category, "after_delete")
+def _invalidate_category_tree(mapper, connection, target) -> None:
+    _mark_stale(target, CATEGORY_TREE_KEY)
+
+
+# Strong references to in-flight delete tasks so they aren't garbage collected
+_pending: Set[asyncio.Task] = set()
+
+
+# after_commit runs once the DB transaction is already committed, so a Redis
+# failure here is logged, never raised: the entry then lives out its TTL.
+def _log_delete_failure(keys: Set[str], exc: BaseException) -> None:
+    logger.warning("Cache invalidation failed for %s", sorted(keys), exc_info=exc)
+
+
+def _on_delete_done(keys: Set[str], task: asyncio.Task) -> None:
+    _pending.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        _log_delete_failure(keys, task.exception())
+
+
+# The shared client's pool is tied to the app's event loop, so a one-off loop
+# gets its own connection
+async def _delete_with_new_client(keys: Set[str]) -> None:
+    client = redis.Redis.from_url(get_settings().REDIS_URL)
+    try:
+        await client.delete(*keys)
+    except RedisError as exc:
+        _log_delete_failure(keys, exc)
+    finally:
+        await client.aclose()
+
+
+@event.listens_for(Session, "after_commit")
+def _drop_stale_keys(session: Session) -> None:
+    keys = session.info.pop(_STALE_KEYS, None)
+    if not keys:
+        return
+    try:
+        # Under AsyncSession this runs in a greenlet on the event loop thread
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # Plain sync Session (scripts, migrations): no loop to schedule on
+        asyncio.run(_delete_with_new_client(keys))
+        return
+    task = loop.create_task(get_redis().delete(*keys))
+    _pending.add(task)
+    task.add_done_callback(partial(_on_delete_done, keys))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_stale_keys(session: Session) -> None:
+    session.info.pop(_STALE_KEYS, None)
@@ -0,0 +1,49 @@
+from decimal import Decimal
+from typing import Any
+
+import msgspec
+import orjson
+import pydantic_core
+from fastapi.responses import ORJSONResponse as _ORJSONResponse
+from fastapi.responses import Response
+
+# Encoders are reusable and keep an internal buffer, so build one per process
+_encoder = msgspec.json.Encoder()
+
+
+# orjson has no native Decimal support; emit prices/amounts as strings,
+# matching what Pydantic produces for Decimal fields in JSON mode
+def _orjson_default(obj: Any) -> Any:
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError
+
+
+# Default response class for the app.
+# Same as FastAPI's ORJSONResponse, plus Decimal handling so routes can
+# return model_dump() output directly without going through jsonable_encoder.
+class ORJSONResponse(_ORJSONResponse):
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+# JSON response encoded by msgspec.
+# Use with response_model=None for routes returning msgspec.Struct schemas
+# (ProductList, OrderList, Cart); bypasses jsonable_encoder entirely.
+class MsgspecJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return _encoder.encode(content)
+
+
+# JSON response for trusted Pydantic read schemas (a model or a list of models),
+# serialized by pydantic-core straight to bytes.
+# Return an instance from the route: FastAPI passes Response objects through
+# untouched, so response_model=... can stay on the decorator for OpenAPI while
+# response validation and jsonable_encoder are skipped.
+class PydanticJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return pydantic_core.to_json(content)
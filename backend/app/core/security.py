@@ -0,0 +1,43 @@
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from jose import JWTError, jwt
+
+from app.core.config import get_settings
+
+
+# Encoded once per key; jose would otherwise encode the str key on every sign/verify
+@lru_cache(maxsize=1)
+def _encode_key(secret: str) -> bytes:
+    return secret.encode()
+
+
+def create_access_token(subject: Any, expires_delta: Optional[timedelta] = None) -> str:
+    settings = get_settings()
+    expire = datetime.now(timezone.utc) + (
+        expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    )
+    claims = {"sub": str(subject), "exp": expire, "jti": uuid.uuid4().hex}
+    return jwt.encode(claims, _encode_key(settings.SECRET_KEY), algorithm=settings.JWT_ALGORITHM)
+
+
+# Signature verification is deterministic per token and key, so verified claims
+# are cached by raw token. Expiry is still checked on every call.
+@lru_cache(maxsize=4096)
+def _verify(token: str, key: bytes, algorithm: str) -> Dict[str, Any]:
+    return jwt.decode(token, key, algorithms=[algorithm])
+
+
+def decode_access_token(token: str) -> Optional[Dict[str, Any]]:
+    settings = get_settings()
+    try:
+        claims = _verify(token, _encode_key(settings.SECRET_KEY), settings.JWT_ALGORITHM)
+    except JWTError:
+        return None
+    if claims.get("exp", 0) <= time.time():
+        return None
+    # Copy: the cached dict is shared by every caller presenting this token
+    return dict(claims)
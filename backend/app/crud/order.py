@@ -0,0 +1,82 @@
+from typing import List, Optional
+
+import msgspec
+from sqlalchemy import Integer, Numeric, cast, column, func, insert, literal, select, update, values
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, noload
+
+from app.models import Order, OrderItem, OrderStatus, Product
+from app.schemas.order import Order as OrderSchema
+from app.schemas.order import OrderCreate, OrderList
+
+
+# Create an order and its items without per-item Python arithmetic.
+# Items are inserted with a single INSERT ... SELECT joined against products,
+# so unit_price/subtotal come from price_cents in Postgres, and total_amount
+# is summed there too.
+# OrderCreate guarantees at least one item and positive quantities.
+async def create_order(db: AsyncSession, user_id: int, order_in: OrderCreate) -> Order:
+    order = Order(user_id=user_id, shipping_address=order_in.shipping_address, total_amount=0)
+    db.add(order)
+    await db.flush()
+
+    requested = values(
+        column("product_id", Integer), column("quantity", Integer), name="requested"
+    ).data([(item.product_id, item.quantity) for item in order_in.items])
+    price = cast(Product.price_cents, Numeric(10, 2)) / 100
+    inserted = await db.execute(
+        insert(OrderItem)
+        .from_select(
+            ["order_id", "product_id", "quantity", "unit_price", "subtotal"],
+            select(
+                literal(order.id),
+                Product.id,
+                requested.c.quantity,
+                price,
+                price * requested.c.quantity,
+            )
+            .join(requested, requested.c.product_id == Product.id)
+            .where(Product.is_active.is_(True)),
+        )
+        .returning(OrderItem.id)
+    )
+    if len(inserted.all()) != len(order_in.items):
+        await db.rollback()
+        raise ValueError("Order references unknown or inactive products")
+
+    await db.execute(
+        update(Order)
+        .where(Order.id == order.id)
+        .values(
+            total_amount=select(func.sum(OrderItem.subtotal))
+            .where(OrderItem.order_id == order.id)
+            .scalar_subquery()
+        )
+    )
+    await db.commit()
+    # Reload everything the Order schema renders: total_amount, server-side
+    # timestamps, the deferred shipping_address and the items
+    await db.refresh(order, list(OrderSchema.model_fields))
+    return order
+
+
+# A user's orders, newest first, optionally filtered by status; served by
+# ix_orders_user_status_created. Only the OrderList columns are selected, and
+# the mapper-level selectin load of order_items is switched off.
+async def list_orders(
+    db: AsyncSession, user_id: int, status: Optional[OrderStatus] = None
+) -> List[OrderList]:
+    query = (
+        select(Order)
+        .options(
+            load_only(Order.id, Order.total_amount, Order.status, Order.created_at_ms),
+            noload(Order.order_items),
+        )
+        .where(Order.user_id == user_id)
+        .order_by(Order.created_at.desc())
+    )
+    if status is not None:
+        query = query.where(Order.status == status.value)
+    rows = (await db.scalars(query)).all()
+    return [msgspec.convert(row, OrderList, from_attributes=True) for row in rows]
+
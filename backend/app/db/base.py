@@ -1,18 +1,21 @@
-from sqlalchemy import create_engine
+from typing import AsyncGenerator
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from app.core.config import settings
+from app.core.config import get_settings
 
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# query_cache_size: per-engine LRU of compiled statements (default 500); sized so
+# the repeated by-id / by-category query shapes are never evicted
+engine = create_async_engine(
+    get_settings().DATABASE_URL, pool_size=20, max_overflow=40, query_cache_size=1200
+)
+# expire_on_commit=False: attributes stay readable after commit without an implicit (sync) refresh
+SessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
 
 Base = declarative_base()
 
 
 # Dependency
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -1,8 +1,12 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from app.core.config import settings
+from app.core.config import get_settings
+from app.core.responses import ORJSONResponse
+import app.core.cache  # noqa: F401  registers cache invalidation listeners
 
-app = FastAPI(title=settings.PROJECT_NAME)
+settings = get_settings()
+
+app = FastAPI(title=settings.PROJECT_NAME, default_response_class=ORJSONResponse)
 
 # CORS middleware
 app.add_middleware(
@@ -14,11 +18,15 @@ app.add_middleware(
 )
 
 
+# Body is constant and the endpoint is polled by load balancers: encode it once
+_HEALTH_BODY = ORJSONResponse({"status": "healthy"}).body
+
+
 @app.get("/")
-def root():
+async def root():
     return {"message": "ESHOP API"}
 
 
 @app.get("/health")
-def health_check():
-    return {"status": "healthy"}
+async def health_check():
+    return Response(_HEALTH_BODY, media_type="application/json")
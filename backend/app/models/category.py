@@ -1,5 +1,5 @@
 from sqlalchemy import Column, Integer, String, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, backref
 from app.db.base import Base
 
 
@@ -12,7 +12,15 @@ class Category(Base):
     parent_id = Column(Integer, ForeignKey("categories.id"), nullable=True)
 
     # Self-referential relationship
-    parent = relationship("Category", remote_side=[id], backref="children")
+    # children are selectin-loaded for up to join_depth levels below the queried rows,
+    # one extra query per level. Deeper levels are left unloaded, and touching them
+    # under AsyncSession raises MissingGreenlet: use selectinload(Category.children,
+    # recursion_depth=...) for deeper trees.
+    parent = relationship(
+        "Category",
+        remote_side=[id],
+        backref=backref("children", lazy="selectin", join_depth=3),
+    )
 
     # Relationships
     products = relationship("Product", back_populates="category")
@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, String, Numeric, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, BigInteger, String, Numeric, DateTime, ForeignKey, cast
+from sqlalchemy import CheckConstraint, Index, text
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred, column_property
 import enum
 from app.db.base import Base
 
@@ -15,15 +16,37 @@ class OrderStatus(str, enum.Enum):
 
 class Order(Base):
     __tablename__ = "orders"
+    # Enum columns (here and User.role) are plain strings instead of a native ENUM type;
+    # allowed values are enforced with a CHECK constraint
+    __table_args__ = (
+        CheckConstraint(
+            "status IN (" + ", ".join(f"'{s.value}'" for s in OrderStatus) + ")",
+            name="ck_orders_status",
+        ),
+        # Serves "my recent orders by status" from a single B-tree scan
+        Index("ix_orders_user_status_created", "user_id", "status", text("created_at DESC")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     total_amount = Column(Numeric(10, 2), nullable=False)
-    status = Column(SQLEnum(OrderStatus), default=OrderStatus.PENDING, nullable=False, index=True)
-    shipping_address = Column(String, nullable=False)
+    status = Column(String(16), default=OrderStatus.PENDING.value, nullable=False)
+    # Not part of OrderList. Deferred: detail queries must use undefer_group("details")
+    shipping_address = deferred(Column(String, nullable=False), group="details")
+    # Indexed on its own for admin views sorting all orders by date
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # created_at as epoch milliseconds, computed in Postgres so list queries decode a
+    # plain int instead of a tz-aware datetime. Deferred: see crud.order.list_orders.
+    created_at_ms = column_property(
+        cast(func.extract("epoch", created_at) * 1000, BigInteger), deferred=True
+    )
 
     # Relationships
     user = relationship("User", back_populates="orders")
-    order_items = relationship("OrderItem", back_populates="order", cascade="all, delete-orphan")
+    # Rendered by the Order detail schema, so load all items for a batch of orders in
+    # one query. List queries that don't render items must opt out with
+    # noload(Order.order_items): load_only() does not suppress relationship loads.
+    order_items = relationship(
+        "OrderItem", back_populates="order", cascade="all, delete-orphan", lazy="selectin"
+    )
@@ -1,13 +1,14 @@
-from sqlalchemy import Column, Integer, Numeric, ForeignKey
+from sqlalchemy import Column, Integer, Numeric, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
 
 class OrderItem(Base):
     __tablename__ = "order_items"
+    __table_args__ = (Index("ix_order_items_order_product", "order_id", "product_id"),)
 
     id = Column(Integer, primary_key=True, index=True)
-    order_id = Column(Integer, ForeignKey("orders.id"), nullable=False, index=True)
+    order_id = Column(Integer, ForeignKey("orders.id"), nullable=False)
     product_id = Column(Integer, ForeignKey("products.id"), nullable=False, index=True)
     quantity = Column(Integer, nullable=False)
     unit_price = Column(Numeric(10, 2), nullable=False)
@@ -15,4 +16,5 @@ class OrderItem(Base):
 
     # Relationships
     order = relationship("Order", back_populates="order_items")
-    product = relationship("Product", back_populates="order_items")
+    # Single-valued FK, so a JOIN on the items query is cheaper than a second round-trip
+    product = relationship("Product", back_populates="order_items", lazy="joined")
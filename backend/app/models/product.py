@@ -1,6 +1,8 @@
-from sqlalchemy import Column, Integer, String, Numeric, Boolean, DateTime, ForeignKey
+from decimal import Decimal
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
+from sqlalchemy.ext.hybrid import hybrid_property
 from app.db.base import Base
 
 
@@ -9,8 +11,10 @@ class Product(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False, index=True)
-    description = Column(String)
-    price = Column(Numeric(10, 2), nullable=False)
+    # Not part of ProductList. Deferred: detail queries must use undefer_group("details")
+    description = deferred(Column(String), group="details")
+    # Stored as integer cents; list endpoints emit this directly
+    price_cents = Column(Integer, nullable=False)
     stock_quantity = Column(Integer, default=0, nullable=False)
     category_id = Column(Integer, ForeignKey("categories.id"), nullable=False)
     image_url = Column(String)
@@ -21,3 +25,17 @@ class Product(Base):
     # Relationships
     category = relationship("Category", back_populates="products")
     order_items = relationship("OrderItem", back_populates="product")
+
+    # Decimal view of price_cents, built only when Python code asks for it
+    @hybrid_property
+    def price(self) -> Decimal:
+        return Decimal(self.price_cents).scaleb(-2)
+
+    @price.inplace.setter
+    def _price_setter(self, value) -> None:
+        self.price_cents = int((Decimal(value) * 100).to_integral_value())
+
+    @price.inplace.expression
+    @classmethod
+    def _price_expression(cls):
+        return cls.price_cents / 100
@@ -1,4 +1,8 @@
 # Schemas module
+from typing import List
+
+import msgspec
+
 from app.schemas.user import (
     User,
     UserCreate,
@@ -49,3 +53,10 @@ __all__ = [
     "CartItemAdd",
     "CartItemUpdate",
 ]
+
+# Pydantic models build their validators at class definition, but msgspec builds
+# and caches Struct type info lazily on first encode/convert. Do it at import time
+# so the first list/cart request doesn't pay for it.
+for _t in (List[ProductList], List[OrderList], Cart):
+    msgspec.json.Decoder(_t)
+del _t
@@ -0,0 +1,40 @@
+from typing import Any, Dict, Set
+
+from sqlalchemy import inspect
+
+from app.core.config import get_settings
+
+# Deferred column group for large text fields not shown in list schemas
+DETAILS_GROUP = "details"
+
+
+def _unloaded_message(schema: str, mapper: Any, missing: Set[str]) -> str:
+    message = f"{schema} needs unloaded attributes {sorted(missing)}; "
+    if any(getattr(mapper.attrs[name], "group", None) == DETAILS_GROUP for name in missing):
+        return message + f'query with .options(undefer_group("{DETAILS_GROUP}"))'
+    return message + "load them in the query or refresh the object before building the schema"
+
+
+# Mixin for read schemas built from ORM rows on response paths.
+# Rows come from a typed DB, so when TRUST_DB_DATA is set the schema is
+# built with model_construct and Pydantic validation is skipped entirely.
+# Enum columns are stored as plain strings, so schemas with enum fields
+# override _orm_values to coerce them back (model_construct won't).
+# Every schema field must already be loaded: under AsyncSession an unloaded
+# attribute can't be fetched on access. Detail queries for Product/Order must
+# use .options(undefer_group("details")) for their deferred text columns.
+class ORMFastMixin:
+    @classmethod
+    def _orm_values(cls, obj: Any) -> Dict[str, Any]:
+        return {f: getattr(obj, f) for f in cls.model_fields}
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any):
+        state = inspect(obj, raiseerr=False)
+        if state is not None:
+            missing = state.unloaded & cls.model_fields.keys()
+            if missing:
+                raise ValueError(_unloaded_message(cls.__name__, state.mapper, missing))
+        if not get_settings().TRUST_DB_DATA:
+            return cls.model_validate(obj)
+        return cls.model_construct(**cls._orm_values(obj))
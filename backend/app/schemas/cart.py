@@ -1,20 +1,22 @@
+import msgspec
 from pydantic import BaseModel
 from datetime import datetime
 from typing import List
 
 
 # Schema for cart item
-class CartItem(BaseModel):
+class CartItem(msgspec.Struct, frozen=True, gc=False):
     product_id: int
     quantity: int
     added_at: datetime
 
 
 # Schema for cart
-class Cart(BaseModel):
+# Carts live in Redis and are encoded/decoded with msgspec, so they are Structs too.
+class Cart(msgspec.Struct):
     user_id: int
-    items: List[CartItem] = []
     expires_at: datetime
+    items: List[CartItem] = []
 
 
 # Schema for adding item to cart
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, ConfigDict
 from typing import Optional
+from app.schemas.base import ORMFastMixin
 
 
 # Base schema
@@ -22,7 +23,7 @@ class CategoryUpdate(BaseModel):
 
 
 # Schema for category in DB
-class Category(CategoryBase):
+class Category(ORMFastMixin, CategoryBase):
     id: int
 
     model_config = ConfigDict(from_attributes=True)
@@ -1,20 +1,25 @@
-from pydantic import BaseModel, ConfigDict
+import msgspec
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from decimal import Decimal
 from typing import Optional, List
 from app.models.order import OrderStatus
+from app.schemas.base import ORMFastMixin
 
 
 # Base schema
+# Instantiated once per item on order responses; frozen with no extras.
 class OrderItemBase(BaseModel):
     product_id: int
     quantity: int
     unit_price: Decimal
     subtotal: Decimal
 
+    model_config = ConfigDict(frozen=True, extra="forbid", validate_assignment=False)
+
 
 # Schema for order item in DB
-class OrderItem(OrderItemBase):
+class OrderItem(ORMFastMixin, OrderItemBase):
     id: int
     order_id: int
 
@@ -24,7 +29,7 @@ class OrderItem(OrderItemBase):
 # Schema for order item creation
 class OrderItemCreate(BaseModel):
     product_id: int
-    quantity: int
+    quantity: int = Field(gt=0)
 
 
 # Base schema for order
@@ -34,7 +39,7 @@ class OrderBase(BaseModel):
 
 # Schema for order creation
 class OrderCreate(OrderBase):
-    items: List[OrderItemCreate]
+    items: List[OrderItemCreate] = Field(min_length=1)
 
 
 # Schema for order update
@@ -44,7 +49,7 @@ class OrderUpdate(BaseModel):
 
 
 # Schema for order in DB
-class Order(OrderBase):
+class Order(ORMFastMixin, OrderBase):
     id: int
     user_id: int
     total_amount: Decimal
@@ -55,12 +60,19 @@ class Order(OrderBase):
 
     model_config = ConfigDict(from_attributes=True)
 
+    @classmethod
+    def _orm_values(cls, obj) -> dict:
+        # model_construct does not recurse, so build nested items explicitly
+        values = super()._orm_values(obj)
+        values["status"] = OrderStatus(obj.status)
+        values["order_items"] = [OrderItem.from_orm_fast(item) for item in obj.order_items]
+        return values
+
 
 # Schema for order list (simplified)
-class OrderList(BaseModel):
+# msgspec.Struct, like ProductList. Built by crud.order.list_orders.
+class OrderList(msgspec.Struct, frozen=True, gc=False):
     id: int
     total_amount: Decimal
     status: OrderStatus
-    created_at: datetime
-
-    model_config = ConfigDict(from_attributes=True)
+    created_at_ms: int
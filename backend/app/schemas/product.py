@@ -1,7 +1,9 @@
+import msgspec
 from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 from decimal import Decimal
 from typing import Optional
+from app.schemas.base import ORMFastMixin
 
 
 # Base schema
@@ -32,7 +34,7 @@ class ProductUpdate(BaseModel):
 
 
 # Schema for product in DB
-class Product(ProductBase):
+class Product(ORMFastMixin, ProductBase):
     id: int
     created_at: datetime
     updated_at: Optional[datetime] = None
@@ -41,11 +43,12 @@ class Product(ProductBase):
 
 
 # Schema for product list (simplified)
-class ProductList(BaseModel):
+# msgspec.Struct instead of BaseModel: instantiated once per row on list endpoints.
+# Build from ORM rows with msgspec.convert(row, ProductList, from_attributes=True).
+# Price is sent as integer cents (raw JSON int); the client divides by 100.
+class ProductList(msgspec.Struct, frozen=True, gc=False):
     id: int
     name: str
-    price: Decimal
-    image_url: Optional[str] = None
+    price_cents: int
     is_active: bool
-
-    model_config = ConfigDict(from_attributes=True)
+    image_url: Optional[str] = None
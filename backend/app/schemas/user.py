@@ -2,6 +2,7 @@ from pydantic import BaseModel, EmailStr, ConfigDict
 from datetime import datetime
 from typing import Optional
 from app.models.user import UserRole
+from app.schemas.base import ORMFastMixin
 
 
 # Base schema
@@ -25,13 +26,19 @@ class UserUpdate(BaseModel):
 
 
 # Schema for user in DB
-class User(UserBase):
+class User(ORMFastMixin, UserBase):
     id: int
     created_at: datetime
     updated_at: Optional[datetime] = None
 
     model_config = ConfigDict(from_attributes=True)
 
+    @classmethod
+    def _orm_values(cls, obj) -> dict:
+        values = super()._orm_values(obj)
+        values["role"] = UserRole(obj.role)
+        return values
+
 
 # Schema for login
 class UserLogin(BaseModel):
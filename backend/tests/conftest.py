@@ -0,0 +1,21 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+import app.models  # noqa: F401  registers every table on Base.metadata
+
+
+# Sync in-memory SQLite session for mapper-level tests (no Postgres needed)
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    with Session(engine) as session:
+        yield session
@@ -0,0 +1,96 @@
+import asyncio
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import List
+
+import pytest
+from sqlalchemy import select
+
+from app.core.cache import (
+    CATEGORY_TREE_KEY,
+    CATEGORY_TREE_TTL,
+    _STALE_KEYS,
+    _decoder_for,
+    _encoder,
+    _pending,
+    cached,
+    get_redis,
+    product_key,
+)
+from app.core.config import get_settings
+from app.models import Category, Product
+from app.schemas import Category as CategorySchema
+from app.schemas import Product as ProductSchema
+from app.schemas import ProductList
+
+
+def test_decode_list_of_models():
+    tree = [CategorySchema(id=1, name="Books"), CategorySchema(id=2, name="Comics", parent_id=1)]
+    assert _decoder_for(List[CategorySchema])(_encoder.encode(tree)) == tree
+
+
+def test_decode_model_with_decimal_and_datetime():
+    product = ProductSchema(
+        id=1,
+        name="Pen",
+        price=Decimal("1.50"),
+        category_id=1,
+        created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+    assert _decoder_for(ProductSchema)(_encoder.encode(product)) == product
+
+
+def test_decode_list_of_structs():
+    rows = [ProductList(id=1, name="Pen", price_cents=150, is_active=True)]
+    assert _decoder_for(List[ProductList])(_encoder.encode(rows)) == rows
+
+
+def test_stale_keys_held_until_transaction_ends(db):
+    category = Category(name="Books")
+    db.add(category)
+    db.flush()
+    product = Product(name="Pen", price=Decimal("1.50"), category_id=category.id)
+    db.add(product)
+    db.flush()
+
+    product.price = Decimal("2.00")
+    db.flush()
+    assert db.info[_STALE_KEYS] == {CATEGORY_TREE_KEY, product_key(product.id)}
+
+    db.rollback()
+    assert _STALE_KEYS not in db.info
+
+
+@pytest.fixture
+def unreachable_redis(monkeypatch):
+    monkeypatch.setattr(get_settings(), "REDIS_URL", "redis://127.0.0.1:1/0")
+    get_redis.cache_clear()
+    yield
+    get_redis.cache_clear()
+
+
+def test_cached_falls_back_to_loader_when_redis_down(unreachable_redis):
+    @cached(lambda: CATEGORY_TREE_KEY, CATEGORY_TREE_TTL, List[CategorySchema])
+    async def load_tree():
+        return [CategorySchema(id=1, name="Books")]
+
+    assert asyncio.run(load_tree()) == [CategorySchema(id=1, name="Books")]
+
+
+def test_commit_succeeds_when_redis_down(unreachable_redis, db):
+    db.add(Category(name="Books"))
+    db.commit()
+
+    assert db.scalars(select(Category.name)).all() == ["Books"]
+
+
+def test_async_commit_succeeds_when_redis_down(unreachable_redis, db):
+    async def commit():
+        db.add(Category(name="Books"))
+        db.commit()
+        # Let the scheduled invalidation run and fail
+        while _pending:
+            await asyncio.sleep(0.01)
+
+    asyncio.run(commit())
+    assert db.scalars(select(Category.name)).all() == ["Books"]
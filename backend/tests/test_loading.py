@@ -0,0 +1,58 @@
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event, inspect, select
+
+from app.models import Category, Order, OrderItem, Product, User
+
+
+@pytest.fixture
+def queries(engine):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
+
+
+def test_orders_load_items_and_products_in_two_queries(db, queries):
+    user = User(email="a@example.com", password_hash="x", name="A")
+    category = Category(name="Books")
+    products = [Product(name=f"P{i}", price=Decimal("1.00"), category=category) for i in range(3)]
+    for n in range(5):
+        order = Order(user=user, total_amount=Decimal("3.00"), shipping_address="Somewhere")
+        order.order_items = [
+            OrderItem(product=p, quantity=1, unit_price=Decimal("1.00"), subtotal=Decimal("1.00"))
+            for p in products
+        ]
+        db.add(order)
+    db.flush()
+    db.expunge_all()
+    queries.clear()
+
+    orders = db.scalars(select(Order)).all()
+    names = [item.product.name for order in orders for item in order.order_items]
+
+    assert len(names) == 15
+    assert len(queries) == 2
+
+
+def test_category_children_eager_and_products_lazy(db, queries):
+    root = Category(name="root")
+    child = Category(name="child", parent=root)
+    Category(name="grandchild", parent=child)
+    db.add(root)
+    db.flush()
+    db.expunge_all()
+    queries.clear()
+
+    loaded = db.scalars(select(Category).where(Category.parent_id.is_(None))).one()
+
+    state = inspect(loaded)
+    assert "children" not in state.unloaded
+    assert "children" not in inspect(loaded.children[0]).unloaded
+    assert "products" in state.unloaded
+    assert not any("FROM products" in q for q in queries)
@@ -0,0 +1,21 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+# Each check runs in a fresh interpreter so no other test has already
+# imported the full model set.
+@pytest.mark.parametrize(
+    "module",
+    ["app.schemas.user", "app.schemas.order", "app.schemas.product", "app.models.order"],
+)
+def test_mappers_configure_after_single_module_import(module):
+    code = f"import {module}\nfrom sqlalchemy.orm import configure_mappers\nconfigure_mappers()\n"
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,51 @@
+from decimal import Decimal
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.orm import undefer_group
+
+from app.models import Category, Product
+from app.schemas import Category as CategorySchema
+from app.schemas import OrderCreate
+from app.schemas import Product as ProductSchema
+
+
+def test_order_create_requires_items():
+    with pytest.raises(ValidationError):
+        OrderCreate(shipping_address="Somewhere", items=[])
+
+
+@pytest.mark.parametrize("quantity", [0, -1])
+def test_order_item_quantity_must_be_positive(quantity):
+    with pytest.raises(ValidationError):
+        OrderCreate(shipping_address="Somewhere", items=[{"product_id": 1, "quantity": quantity}])
+
+
+def test_from_orm_fast_requires_deferred_columns_loaded(db):
+    category = Category(name="Books", description="All books")
+    db.add(category)
+    db.flush()
+    db.add(Product(name="Pen", description="Blue", price=Decimal("1.50"), category_id=category.id))
+    db.flush()
+    db.expunge_all()
+
+    assert CategorySchema.from_orm_fast(db.scalars(select(Category)).one()).description == "All books"
+
+    with pytest.raises(ValueError, match="undefer_group"):
+        ProductSchema.from_orm_fast(db.scalars(select(Product)).one())
+    db.expunge_all()
+
+    product = db.scalars(select(Product).options(undefer_group("details"))).one()
+    assert ProductSchema.from_orm_fast(product).description == "Blue"
+
+
+def test_from_orm_fast_plain_unloaded_column_suggests_refresh(db):
+    category = Category(name="Books")
+    db.add(category)
+    db.flush()
+    db.expire(category, ["name"])
+
+    with pytest.raises(ValueError, match="refresh") as excinfo:
+        CategorySchema.from_orm_fast(category)
+    assert "undefer_group" not in str(excinfo.value)
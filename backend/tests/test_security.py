@@ -0,0 +1,29 @@
+from datetime import timedelta
+
+from app.core.config import get_settings
+from app.core.security import create_access_token, decode_access_token
+
+
+def test_decode_round_trip():
+    claims = decode_access_token(create_access_token(42))
+    assert claims["sub"] == "42"
+    assert claims["jti"]
+
+
+def test_decoded_claims_are_not_shared():
+    token = create_access_token(42)
+    decode_access_token(token)["sub"] = "999"
+    assert decode_access_token(token)["sub"] == "42"
+
+
+def test_expired_and_invalid_tokens_rejected():
+    assert decode_access_token(create_access_token(42, timedelta(seconds=-1))) is None
+    assert decode_access_token("not-a-token") is None
+
+
+def test_tokens_rejected_after_secret_key_change(monkeypatch):
+    token = create_access_token(42)
+    assert decode_access_token(token) is not None
+
+    monkeypatch.setattr(get_settings(), "SECRET_KEY", "rotated")
+    assert decode_access_token(token) is None
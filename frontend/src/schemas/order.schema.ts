@@ -211,7 +211,7 @@ export const OrderListSchema = t.type({
   id: OrderIdCodec,
   total_amount: PriceCodec,
   status: OrderStatusSchema,
-  created_at: datetimeString,
+  created_at_ms: t.number, // エポックミリ秒
 });
 
 export type OrderList = t.TypeOf<typeof OrderListSchema>;
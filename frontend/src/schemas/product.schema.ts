@@ -189,7 +189,7 @@ export type ProductUpdate = t.TypeOf<typeof ProductUpdateSchema>;
 export const ProductListSchema = t.type({
   id: ProductIdCodec,
   name: t.string,
-  price: PriceCodec,
+  price_cents: t.number, // 整数（セント単位）
   image_url: t.union([t.string, t.undefined]),
   is_active: t.boolean,
 });
@@ -47,5 +47,5 @@ export interface OrderList {
   id: OrderId;
   total_amount: Price;
   status: OrderStatus;
-  created_at: string;
+  created_at_ms: number; // エポックミリ秒
 }
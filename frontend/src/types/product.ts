@@ -36,7 +36,7 @@ export interface ProductUpdate {
 export interface ProductList {
   id: ProductId;
   name: string;
-  price: Price;
+  price_cents: number; // 整数（セント単位）。表示時に100で割る
   image_url?: string;
   is_active: boolean;
 }